@@ -1,12 +1,18 @@
+from collections import Counter
 from typing import Any
 
 from models import Finding, SectionSummary
 
+_STOPWORDS = frozenset({'the', 'and', 'for', 'with', 'this', 'that', 'from', 'are', 'was', 'were'})
+
 
 class ContextManager:
 	def __init__(self, llm_client: Any):
 		self.llm_client = llm_client
 		self.summaries: list[SectionSummary] = []
+		self._summaries_by_section: dict[int, SectionSummary] = {}
+		# (current_section_id, window_size, len(summaries)) -> context; summaries are append-only
+		self._context_cache: dict[tuple[int, int, int], str] = {}
 
 	def summarize_section(
 		self, section_id: int, section_title: str, content: str, sources_used: list[str]
@@ -42,8 +48,9 @@ FINDINGS:
 			elif line.startswith('FINDINGS:'):
 				in_findings = True
 			elif in_findings and line.strip() and '(sources:' in line:
-				text = line.split('(sources:')[0].strip().lstrip('0123456789. ')
-				source_str = line.split('(sources:')[1].rstrip(')')
+				parts = line.split('(sources:')
+				text = parts[0].strip().lstrip('0123456789. ')
+				source_str = parts[1].rstrip(')')
 				source_ids = [s.strip() for s in source_str.split(',')]
 				findings.append(Finding(text=text, source_ids=source_ids, section_id=section_id))
 
@@ -59,40 +66,39 @@ FINDINGS:
 			key_terms=key_terms[:10],  # Limit to 10
 		)
 
-		self.summaries.append(summary)
+		self.add_summary(summary)
 		return summary
 
+	def add_summary(self, summary: SectionSummary) -> None:
+		self.summaries.append(summary)
+		self._summaries_by_section.setdefault(summary.section_id, summary)
+
+	def has_summary(self, section_id: int) -> bool:
+		return section_id in self._summaries_by_section
+
 	def get_context_for_section(self, current_section_id: int, window_size: int = 3) -> str:
 		"""Get compressed context from prior sections"""
 		if current_section_id == 0:
 			return ''
 
+		cache_key = (current_section_id, window_size, len(self.summaries))
+		cached = self._context_cache.get(cache_key)
+		if cached is not None:
+			return cached
+
 		# Get last N summaries
 		relevant_summaries = self.summaries[max(0, current_section_id - window_size) : current_section_id]
 
-		context_parts = []
-		for summary in relevant_summaries:
-			context_parts.append(f"""
-## {summary.section_title} (Summary)
-{summary.summary}
-
-Key findings:
-{chr(10).join(f'- {f.text}' for f in summary.key_findings)}
-""")
-
-		return '\n'.join(context_parts)
+		context = '\n'.join(summary.context_block for summary in relevant_summaries)
+		self._context_cache[cache_key] = context
+		return context
 
 	def extract_findings_for_refinement(self, section_id: int) -> list[Finding]:
-		for summary in self.summaries:
-			if summary.section_id == section_id:
-				return summary.key_findings
-		return []
+		summary = self._summaries_by_section.get(section_id)
+		return summary.key_findings if summary else []
 
 	def _extract_key_terms(self, words: list[str]) -> list[str]:
-		from collections import Counter
-
-		stopwords = {'the', 'and', 'for', 'with', 'this', 'that', 'from', 'are', 'was', 'were'}
-		meaningful = [w for w in words if len(w) > 4 and w not in stopwords]
+		meaningful = [w for w in words if len(w) > 4 and w not in _STOPWORDS]
 
 		counter = Counter(meaningful)
 		return [term for term, count in counter.most_common(10)]
@@ -5,10 +5,15 @@ from utils.logger import logger
 
 
 class EditorAgent:
-	def __init__(self, llm_client: UnifiedLLMClient):
+	def __init__(self, llm_client: UnifiedLLMClient, use_llm: bool = False):
 		self.llm_client = llm_client
+		self.use_llm = use_llm
 
 	def remove_redundancy(self, all_sections_content: list[str]) -> list[str]:
+		if not self.use_llm:
+			logger.info('Editor LLM review disabled, keeping sections as written')
+			return all_sections_content
+
 		logger.info('Running global coherence editor to remove redundancy...')
 
 		# Combine all sections into a single string for LLM processing
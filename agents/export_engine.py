@@ -1,9 +1,12 @@
 import subprocess
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from utils import file_io
+
 
 class ChapterDefinition:
 	def __init__(self, number: int, title: str, sections: list[str]):
@@ -16,145 +19,154 @@ class ChapterDefinition:
 		return any(s in t or t in s for s in self.sections)
 
 
+# Chapters in export order; section titles are matched against each chapter's section keywords
+_ENGINEERING_CHAPTERS = (
+	ChapterDefinition(
+		1,
+		'Introduction',
+		[
+			'introduction',
+			'background to the study',
+			'statement of the problem',
+			'objective of the study',
+			'significance',
+			'scope of the study',
+			'limitations',
+			'organization of the study',
+			'definition of terms',
+		],
+	),
+	ChapterDefinition(2, 'Literature Review', ['existing approach', 'effort to counter', 'specific approach']),
+	ChapterDefinition(
+		3,
+		'System Analysis and Design',
+		[
+			'system analysis',
+			'method of data collection',
+			'problem of the current system',
+			'objective of the new system',
+			'menu specification',
+			'overview of the system flowchart',
+			'procedural flowchart',
+			'system design',
+		],
+	),
+	ChapterDefinition(
+		4,
+		'System Implementation and Documentation',
+		[
+			'system implementation',
+			'system requirement',
+			'hardware requirement',
+			'software requirement',
+			'test-run',
+			'program documentation',
+			'user manual',
+			'system maintenance',
+		],
+	),
+	ChapterDefinition(5, 'Summary, Conclusion and Recommendation', ['summary', 'conclusion', 'recommendation']),
+)
+
+_GENERAL_CHAPTERS = (
+	ChapterDefinition(
+		1,
+		'Introduction',
+		[
+			'introduction',
+			'background to the study',
+			'statement of the problem',
+			'objective of the study',
+			'significance',
+			'scope of the study',
+			'limitations',
+			'organization of the study',
+			'definition of terms',
+		],
+	),
+	ChapterDefinition(
+		2,
+		'Literature Review',
+		['introduction', 'theoretical framework', 'conceptual framework', 'empirical studies', 'appraisal'],
+	),
+	ChapterDefinition(
+		3,
+		'Methodology',
+		[
+			'research design',
+			'population of the study',
+			'sample and sampling',
+			'instrument for data collection',
+			'validity of the instrument',
+			'reliability of the instrument',
+			'procedure for data collection',
+			'method of data analysis',
+		],
+	),
+	ChapterDefinition(
+		4, 'Results', ['answers to research questions', 'testing of hypotheses', 'summary of the findings']
+	),
+	ChapterDefinition(
+		5,
+		'Discussion, Conclusion and Recommendation',
+		['discussion of the findings', 'implications of the study', 'conclusion', 'recommendation'],
+	),
+)
+
+_CHAPTERS_BY_PROFILE = {'engineering': _ENGINEERING_CHAPTERS}
+
+
 class ExportEngine:
 	def __init__(self, profile_name: str, output_dir: Path | str = 'output'):
 		self.profile_name = profile_name
 		self.output_dir = Path(output_dir)
 		self.output_dir.mkdir(parents=True, exist_ok=True)
-		self.chapters = self._get_chapter_definitions()
-
-	def _get_chapter_definitions(self) -> list[ChapterDefinition]:
-		if self.profile_name == 'engineering':
-			return [
-				ChapterDefinition(
-					1,
-					'Introduction',
-					[
-						'introduction',
-						'background to the study',
-						'statement of the problem',
-						'objective of the study',
-						'significance',
-						'scope of the study',
-						'limitations',
-						'organization of the study',
-						'definition of terms',
-					],
-				),
-				ChapterDefinition(
-					2, 'Literature Review', ['existing approach', 'effort to counter', 'specific approach']
-				),
-				ChapterDefinition(
-					3,
-					'System Analysis and Design',
-					[
-						'system analysis',
-						'method of data collection',
-						'problem of the current system',
-						'objective of the new system',
-						'menu specification',
-						'overview of the system flowchart',
-						'procedural flowchart',
-						'system design',
-					],
-				),
-				ChapterDefinition(
-					4,
-					'System Implementation and Documentation',
-					[
-						'system implementation',
-						'system requirement',
-						'hardware requirement',
-						'software requirement',
-						'test-run',
-						'program documentation',
-						'user manual',
-						'system maintenance',
-					],
-				),
-				ChapterDefinition(
-					5, 'Summary, Conclusion and Recommendation', ['summary', 'conclusion', 'recommendation']
-				),
-			]
-		else:  # management/general
-			return [
-				ChapterDefinition(
-					1,
-					'Introduction',
-					[
-						'introduction',
-						'background to the study',
-						'statement of the problem',
-						'objective of the study',
-						'significance',
-						'scope of the study',
-						'limitations',
-						'organization of the study',
-						'definition of terms',
-					],
-				),
-				ChapterDefinition(
-					2,
-					'Literature Review',
-					['introduction', 'theoretical framework', 'conceptual framework', 'empirical studies', 'appraisal'],
-				),
-				ChapterDefinition(
-					3,
-					'Methodology',
-					[
-						'research design',
-						'population of the study',
-						'sample and sampling',
-						'instrument for data collection',
-						'validity of the instrument',
-						'reliability of the instrument',
-						'procedure for data collection',
-						'method of data analysis',
-					],
-				),
-				ChapterDefinition(
-					4, 'Results', ['answers to research questions', 'testing of hypotheses', 'summary of the findings']
-				),
-				ChapterDefinition(
-					5,
-					'Discussion, Conclusion and Recommendation',
-					['discussion of the findings', 'implications of the study', 'conclusion', 'recommendation'],
-				),
-			]
+		self.chapters = _CHAPTERS_BY_PROFILE.get(profile_name, _GENERAL_CHAPTERS)  # management/general otherwise
 
 	def export_paper(
 		self,
-		sections_dir: Path,
+		section_files: list[Path],
 		sources_db: dict[str, dict[str, Any]],
 		metadata: dict[str, Any],
 		formats: tuple[str, ...] = ('pdf', 'docx'),
+		section_texts: dict[Path, str] | None = None,
 	) -> dict[str, Path]:
-		markdown_content = self._build_complete_markdown(sections_dir, sources_db, metadata)
+		"""section_files: the plan's section files in order; section_texts: bodies already in memory, by path"""
+		markdown_content = self._build_complete_markdown(section_files, sources_db, metadata, section_texts or {})
 		md_file = self.output_dir / f'{metadata["topic"][:50].replace(" ", "_")}.md'
-		md_file.write_text(markdown_content, encoding='utf-8')
+		file_io.write_bytes(md_file, markdown_content.encode())
 
 		outputs = {'markdown': md_file}
 
-		for fmt in formats:
-			if fmt == 'pdf':
-				outputs['pdf'] = self._convert_to_pdf(md_file, metadata)
-			elif fmt == 'docx':
-				outputs['docx'] = self._convert_to_docx(md_file, metadata)
+		converters = {'pdf': self._convert_to_pdf, 'docx': self._convert_to_docx}
+		requested = [fmt for fmt in formats if fmt in converters]
+		# Each format is a separate pandoc process reading the same markdown, so they can run side by side
+		with ThreadPoolExecutor(max_workers=max(1, len(requested))) as executor:
+			futures = {fmt: executor.submit(converters[fmt], md_file, metadata) for fmt in requested}
+			for fmt, future in futures.items():
+				outputs[fmt] = future.result()
 
 		return outputs
 
 	def _build_complete_markdown(
-		self, sections_dir: Path, sources_db: dict[str, dict[str, Any]], metadata: dict[str, Any]
+		self,
+		section_files: list[Path],
+		sources_db: dict[str, dict[str, Any]],
+		metadata: dict[str, Any],
+		section_texts: dict[Path, str],
 	) -> str:
 		parts = [self._build_title_page(metadata), self._build_abstract(metadata)]
 
-		section_files = sorted(sections_dir.glob('*.md'))
 		sections = []
 		for f in section_files:
 			title = f.stem.split('_', 1)[1].replace('_', ' ').title()
-			content = f.read_text(encoding='utf-8')
-			if content.startswith('#'):
-				content = '\n'.join(content.split('\n')[1:]).strip()
+			content = section_texts.get(f)
+			if content is not None:
+				content = content.strip()
+			else:
+				content = f.read_text(encoding='utf-8')
+				if content.startswith('#'):
+					content = content.partition('\n')[2].strip()  # Drop the heading line without splitting every line
 			sections.append({'title': title, 'content': content})
 
 		grouped = self._group_sections_by_chapter(sections)
@@ -172,13 +184,23 @@ class ExportEngine:
 		return ''.join(parts)
 
 	def _group_sections_by_chapter(self, sections: list[dict]) -> list[tuple[int, str, list[dict]]]:
-		grouped = []
-		for chapter in self.chapters:
-			chapter_sections = [s for s in sections if chapter.matches_section(s['title'])]
-			if chapter_sections:
-				grouped.append((chapter.number, chapter.title, chapter_sections))
-
-		unmatched = [s for s in sections if not any(chapter.matches_section(s['title']) for chapter in self.chapters)]
+		# One match pass per section; a section may belong to several chapters
+		by_chapter: list[list[dict]] = [[] for _ in self.chapters]
+		unmatched = []
+		for section in sections:
+			matched = False
+			for chapter_sections, chapter in zip(by_chapter, self.chapters, strict=True):
+				if chapter.matches_section(section['title']):
+					chapter_sections.append(section)
+					matched = True
+			if not matched:
+				unmatched.append(section)
+
+		grouped = [
+			(chapter.number, chapter.title, chapter_sections)
+			for chapter, chapter_sections in zip(self.chapters, by_chapter, strict=True)
+			if chapter_sections
+		]
 		if unmatched:
 			grouped.append((len(self.chapters) + 1, 'Additional Sections', unmatched))
 
@@ -3,17 +3,44 @@ import re
 from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from agents.search_provider import SearchProvider
 from models import SearchResult
 from utils.logger import logger
 
+_TITLE_RE = re.compile(r'Title:\s*(.+)', re.IGNORECASE)
+_AUTHORS_RE = re.compile(r'Authors:\s*(.+)', re.IGNORECASE)
+_YEAR_RE = re.compile(r'Year:\s*(\d{4})', re.IGNORECASE)
+_ID_RE = re.compile(r'ID:\s*(arxiv:\S+|doi:\S+)', re.IGNORECASE)
+_SUMMARY_RE = re.compile(r'Summary:\s*(.+)', re.IGNORECASE | re.DOTALL)
+
 
 class PerplexityProvider(SearchProvider):
 	def __init__(self, api_key: str, model: str = 'sonar'):
 		self.api_key = api_key
 		self.model = model
 		self.base_url = 'https://api.perplexity.ai/chat/completions'
+		# One keep-alive connection for every search instead of a new TLS handshake per query
+		self.session = requests.Session()
+		self.session.headers.update(
+			{
+				'Authorization': f'Bearer {self.api_key}',
+				'Content-Type': 'application/json',
+			}
+		)
+		# Requests are billed, so only retry when the server refused or never got them:
+		# connect errors, 429 and 503. Never a read timeout, 502 or 504, which can follow a served request
+		retry = Retry(
+			total=3,
+			read=0,
+			backoff_factor=0.3,
+			status_forcelist=(429, 503),
+			allowed_methods=frozenset({'POST'}),
+			raise_on_status=False,  # Let raise_for_status report the final response
+		)
+		self.session.mount('https://', HTTPAdapter(max_retries=retry))
 
 	def search(self, query: str, max_results: int = 10) -> list[SearchResult]:
 		logger.info(f'Searching Perplexity for: {query}')
@@ -62,11 +89,6 @@ Summary: [1-2 sentences]
 Only include papers you can verify exist. Do not hallucinate citations."""
 
 	def _call_api(self, prompt: str) -> dict[str, Any]:
-		headers = {
-			'Authorization': f'Bearer {self.api_key}',
-			'Content-Type': 'application/json',
-		}
-
 		payload = {
 			'model': self.model,
 			'messages': [
@@ -82,9 +104,8 @@ Only include papers you can verify exist. Do not hallucinate citations."""
 			],
 		}
 
-		response = requests.post(
+		response = self.session.post(
 			self.base_url,
-			headers=headers,
 			json=payload,
 			timeout=30,
 		)
@@ -108,7 +129,7 @@ Only include papers you can verify exist. Do not hallucinate citations."""
 
 		except Exception as e:
 			logger.error(f'Failed to parse Perplexity response: {e}')
-			logger.debug(f'Response was: {json.dumps(response, indent=2)[:500]}')
+			logger.opt(lazy=True).debug('Response was: {}', lambda: json.dumps(response, indent=2)[:500])
 			return []
 
 	def _parse_papers_from_text(self, text: str) -> list[dict[str, str]]:
@@ -123,24 +144,24 @@ Only include papers you can verify exist. Do not hallucinate citations."""
 
 			paper = {}
 
-			title_match = re.search(r'Title:\s*(.+)', section, re.IGNORECASE)
+			title_match = _TITLE_RE.search(section)
 			if title_match:
 				paper['title'] = title_match.group(1).strip()
 
-			authors_match = re.search(r'Authors:\s*(.+)', section, re.IGNORECASE)
+			authors_match = _AUTHORS_RE.search(section)
 			if authors_match:
 				authors_str = authors_match.group(1).strip()
 				paper['authors'] = [a.strip() for a in authors_str.split(',')]
 
-			year_match = re.search(r'Year:\s*(\d{4})', section, re.IGNORECASE)
+			year_match = _YEAR_RE.search(section)
 			if year_match:
 				paper['year'] = int(year_match.group(1))
 
-			id_match = re.search(r'ID:\s*(arxiv:\S+|doi:\S+)', section, re.IGNORECASE)
+			id_match = _ID_RE.search(section)
 			if id_match:
 				paper['id'] = id_match.group(1).strip()
 
-			summary_match = re.search(r'Summary:\s*(.+)', section, re.IGNORECASE | re.DOTALL)
+			summary_match = _SUMMARY_RE.search(section)
 			if summary_match:
 				paper['summary'] = summary_match.group(1).strip()
 
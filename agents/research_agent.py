@@ -1,13 +1,13 @@
-import os
 import time
 from pathlib import Path
 from typing import Any
 
 from agents.arxiv_provider import ArxivProvider
-from agents.perplexity_provider import PerplexityProvider
 from agents.search_provider import SearchProvider
+from config.settings import settings
 from models import SearchResult
 from search import PaperDeduplicator
+from utils import json_io
 from utils.logger import logger
 
 
@@ -28,14 +28,20 @@ class ResearchAgent:
 
 		self.deduplicator = PaperDeduplicator()
 
-		self.sources_db: dict[str, dict[str, Any]] = {}
+		# Persisted with the run state, so a reused plan's source ids still resolve on later runs
+		self.sources_file = self.storage_dir / 'sources_db.json'
+		self.sources_db: dict[str, dict[str, Any]] = (
+			json_io.read_json(self.sources_file) if self.sources_file.exists() else {}
+		)
 
 	def _initialize_providers(self) -> list[SearchProvider]:
 		providers = []
 
-		perplexity_key = os.getenv('PERPLEXITY_API_KEY')
+		perplexity_key = settings.PERPLEXITY_API_KEY
 		if perplexity_key:
 			try:
+				from agents.perplexity_provider import PerplexityProvider
+
 				provider = PerplexityProvider(perplexity_key)
 				providers.append(provider)
 			except Exception as e:
@@ -91,7 +97,8 @@ class ResearchAgent:
 
 		validated_sources = []
 		for result in unique_results:
-			if self._validate_source(result):
+			# Sources already in the registry passed validation when they were stored
+			if result.source_id in self.sources_db or self._validate_source(result):
 				validated_sources.append(result)
 
 			elapsed = time.time() - start_time
@@ -101,10 +108,13 @@ class ResearchAgent:
 
 		logger.info(f'Validated {len(validated_sources)} sources')
 
+		known = len(self.sources_db)
 		source_ids = []
 		for source in validated_sources:
 			source_id = self._store_source(source)
 			source_ids.append(source_id)
+		if len(self.sources_db) > known:
+			json_io.write_json(self.sources_file, self.sources_db)
 
 		elapsed = time.time() - start_time
 		logger.info(f'Research complete in {elapsed:.1f}s')
@@ -179,6 +189,11 @@ class ResearchAgent:
 		logger.debug(f'Stored source: {source_id}')
 		return source_id
 
+	def clear_sources(self) -> None:
+		"""Forget every stored source (in place, as the validator shares the dict)"""
+		self.sources_db.clear()
+		self.sources_file.unlink(missing_ok=True)
+
 	def get_source(self, source_id: str) -> dict[str, Any] | None:
 		return self.sources_db.get(source_id)
 
@@ -1,6 +1,32 @@
+import re
 from dataclasses import dataclass
 from typing import Any
 
+_PUNCTUATION_RE = re.compile(r'[^\w\s]')
+
+_STOP_WORDS = frozenset(
+	{
+		'which',
+		'their',
+		'about',
+		'should',
+		'these',
+		'those',
+		'there',
+		'where',
+		'would',
+		'could',
+		'point',
+		'study',
+		'paper',
+		'section',
+		'provide',
+		'discuss',
+		'present',
+		'address',
+	}
+)
+
 
 @dataclass
 class SourceRelevance:
@@ -38,33 +64,11 @@ class SourceFilter:
 	def _extract_keywords(self, text: str) -> set[str]:
 		"""Extract meaningful keywords from text"""
 		# Remove punctuation and lowercase
-		import re
-
-		text = re.sub(r'[^\w\s]', '', text.lower())
+		text = _PUNCTUATION_RE.sub('', text.lower())
 		words = text.split()
 
 		# Filter: length >= 3, not very common words
-		stop_words = {
-			'which',
-			'their',
-			'about',
-			'should',
-			'these',
-			'those',
-			'there',
-			'where',
-			'would',
-			'could',
-			'point',
-			'study',
-			'paper',
-			'section',
-			'provide',
-			'discuss',
-			'present',
-			'address',
-		}
-		keywords = {w for w in words if len(w) >= 3 and w not in stop_words}
+		keywords = {w for w in words if len(w) >= 3 and w not in _STOP_WORDS}
 		return keywords
 
 	def _calculate_relevance(self, source: dict[str, Any], objective_keywords: set[str]) -> float:
@@ -1,40 +1,95 @@
-import json
+import hashlib
+import os
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from utils import file_io, json_io
+
 
 class StateManager:
 	def __init__(self, state_dir: Path):
 		self.state_dir = state_dir
 		self.state_file = state_dir / 'state.json'
 		self.plan_file = state_dir / 'plan.json'
+		self.sections_dir = state_dir / 'sections'
 		self.checkpoint_file = state_dir / 'checkpoint.json'
-		self.context_cache_file = state_dir / 'context_cache.json'
+		self.context_cache_file = state_dir / 'context_cache.json'  # Legacy full dump, read for old checkpoints
+		self.context_log_file = state_dir / 'context_cache.jsonl'
+		self._logged_summary_ids: set[int] = set()
+		self.plan_log_file = state_dir / 'plan.log'
+		self._plan_log = None
+		# Last persisted plan: digest of plan.json and per-section field values including the journal
+		self._plan_digest: bytes | None = None
+		self._persisted_sections: dict[int, dict[str, Any]] = {}
 
 	def can_resume(self) -> bool:
 		return self.state_file.exists() and self.plan_file.exists() and self.checkpoint_file.exists()
 
 	def load_checkpoint(self) -> dict[str, Any]:
-		with open(self.checkpoint_file) as f:
-			checkpoint = json.load(f)
-
-		with open(self.state_file) as f:
-			state = json.load(f)
+		checkpoint = json_io.read_json(self.checkpoint_file)
+		state = json_io.read_json(self.state_file)
 
-		with open(self.plan_file) as f:
-			plan = json.load(f)
+		plan = self.load_plan()
 
 		# Load context cache if exists
 		context_cache = {}
 		if self.context_cache_file.exists():
-			with open(self.context_cache_file) as f:
-				context_cache = json.load(f)
+			context_cache = json_io.read_json(self.context_cache_file)
+		if self.context_log_file.exists():
+			for record in json_io.read_jsonl(self.context_log_file):
+				context_cache[str(record['section_id'])] = record['summary']
+		self._logged_summary_ids = {int(section_id) for section_id in context_cache}
 
 		return {'checkpoint': checkpoint, 'state': state, 'plan': plan, 'context_cache': context_cache}
 
+	def load_plan(self) -> dict[str, Any]:
+		"""Load plan.json and replay journaled section updates on top of it"""
+		plan = json_io.read_json(self.plan_file)
+		if not self.plan_log_file.exists():
+			self._remember_sections(plan)
+			return plan
+
+		sections = {s['id']: s for s in plan['sections']}
+		for delta in json_io.read_jsonl(self.plan_log_file):
+			if delta['section_id'] in sections:
+				sections[delta['section_id']].update(delta['fields'])
+		self._remember_sections(plan)
+		return plan
+
+	def save_plan(self, plan: dict[str, Any]) -> None:
+		"""Write the full plan and drop the journal it supersedes"""
+		data = json_io.dumps(plan)
+		digest = hashlib.blake2b(data, digest_size=16).digest()
+		if digest == self._plan_digest and not self.plan_log_file.exists():
+			return
+
+		file_io.write_bytes(self.plan_file, data, fsync=True)
+		self._plan_digest = digest
+		self._remember_sections(plan)
+		if self._plan_log is not None:
+			self._plan_log.close()
+			self._plan_log = None
+		self.plan_log_file.unlink(missing_ok=True)
+
+	def append_plan_delta(self, section_id: int, fields: dict[str, Any]) -> None:
+		"""Journal a per-section update instead of rewriting the whole plan"""
+		persisted = self._persisted_sections.setdefault(section_id, {})
+		fields = {k: v for k, v in fields.items() if k not in persisted or persisted[k] != v}
+		if not fields:
+			return
+		persisted.update(fields)
+
+		if self._plan_log is None:
+			self._plan_log = open(self.plan_log_file, 'ab')  # noqa: SIM115
+		self._plan_log.write(json_io.dumps({'section_id': section_id, 'fields': fields}, indent=False) + b'\n')
+		self._plan_log.flush()
+
+	def _remember_sections(self, plan: dict[str, Any]) -> None:
+		self._persisted_sections = {s['id']: dict(s) for s in plan['sections']}
+
 	def save_checkpoint(
-		self, current_section_id: int, completed_sections: list[int], context_summaries: dict[int, str]
+		self, current_section_id: int, completed_sections: list[int], context_summaries: dict[int, dict[str, Any]]
 	) -> None:
 		checkpoint = {
 			'current_section_id': current_section_id,
@@ -43,21 +98,47 @@ class StateManager:
 			'can_resume': True,
 		}
 
-		# Atomic write (write to temp, then rename)
-		temp_file = self.checkpoint_file.with_suffix('.tmp')
-		with open(temp_file, 'w') as f:
-			json.dump(checkpoint, f, indent=2)
-		temp_file.replace(self.checkpoint_file)
+		# Checkpoints are the durability boundary: flush the plan journal and fsync what we write
+		if self._plan_log is not None:
+			os.fsync(self._plan_log.fileno())
+
+		# Append summaries not yet journaled instead of re-dumping all of them
+		new_summaries = {k: v for k, v in context_summaries.items() if k not in self._logged_summary_ids}
+		if new_summaries:
+			with open(self.context_log_file, 'ab') as f:
+				for section_id, summary in new_summaries.items():
+					f.write(json_io.dumps({'section_id': section_id, 'summary': summary}, indent=False) + b'\n')
+				f.flush()
+				os.fsync(f.fileno())
+			self._logged_summary_ids.update(new_summaries)
+
+		json_io.write_json(self.checkpoint_file, checkpoint, fsync=True)
 
-		# Save context cache
-		if context_summaries:
-			temp_cache = self.context_cache_file.with_suffix('.tmp')
-			with open(temp_cache, 'w') as f:
-				json.dump(context_summaries, f, indent=2)
-			temp_cache.replace(self.context_cache_file)
+	def reset_run(self) -> None:
+		"""Drop every artifact of the previous paper before a new plan replaces it"""
+		self.clear_checkpoint()
+		if self._plan_log is not None:
+			self._plan_log.close()
+			self._plan_log = None
+		self.plan_log_file.unlink(missing_ok=True)
+		self._plan_digest = None
+		self._persisted_sections = {}
+		if self.sections_dir.exists():
+			for path in self.sections_dir.iterdir():
+				if path.is_file():
+					path.unlink()
+
+	def section_file(self, section_id: int, section_title: str) -> Path:
+		return self.sections_dir / f'{section_id:02d}_{self.safe_title(section_title)}.md'
+
+	@staticmethod
+	def safe_title(section_title: str) -> str:
+		# Sanitize filename by replacing spaces and slashes
+		return section_title.lower().replace(' ', '_').replace('/', '_')
 
 	def clear_checkpoint(self) -> None:
 		if self.checkpoint_file.exists():
 			self.checkpoint_file.unlink()
-		if self.context_cache_file.exists():
-			self.context_cache_file.unlink()
+		self.context_cache_file.unlink(missing_ok=True)
+		self.context_log_file.unlink(missing_ok=True)
+		self._logged_summary_ids.clear()
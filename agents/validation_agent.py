@@ -3,13 +3,32 @@ from datetime import datetime
 from typing import Any
 
 from models import IssueType, Severity, ValidationIssue, ValidationResult
-from models.project import Artifact, ArtifactType, ProjectType
+from models.project import ProjectType
+from utils.citations import CITATION_RE
+
+# (phrase, whole-word pattern, future-tense pattern) for claims of work that was actually carried out
+_SPECULATIVE_PHRASES = tuple(
+	(
+		phrase,
+		re.compile(r'\b' + re.escape(phrase) + r'\b', re.IGNORECASE),
+		re.compile(r'will\s+' + re.escape(phrase.replace('we ', '')), re.IGNORECASE),
+	)
+	for phrase in (
+		'we conducted',
+		'we measured',
+		'we implemented',
+		'our results',
+		'data was collected',
+		'experiments showed',
+		'our system',
+	)
+)
 
 
 class CitationValidator:
 	def __init__(self, sources_db: dict[str, dict[str, Any]]):
 		self.sources_db = sources_db
-		self.citation_pattern = r'\[(arxiv:\S+?|doi:\S+?)(?::\s*"[^"]*")?\]'
+		self.citation_pattern = CITATION_RE
 
 	def validate_section(
 		self,
@@ -26,7 +45,7 @@ class CitationValidator:
 		issues.extend(self._check_unearned_claims(content, ProjectType(project_type), artifacts))
 
 		# 2. Extract all citations
-		citations = re.findall(self.citation_pattern, content)
+		citations = self.citation_pattern.findall(content)
 		unique_citations = set(citations)
 
 		# Check each citation exists
@@ -72,37 +91,29 @@ class CitationValidator:
 				)
 			)
 
+		timestamp = datetime.now().isoformat()
 		return ValidationResult(
-			validation_id=f'val_{section_id}_{datetime.now().isoformat()}',
+			validation_id=f'val_{section_id}_{timestamp}',
 			section_id=section_id,
 			passed=len([i for i in issues if i.severity == Severity.CRITICAL]) == 0,
 			issues=issues,
 			attempt=1,
-			timestamp=datetime.now().isoformat(),
+			timestamp=timestamp,
 			missing_topics=missing_topics if missing_sources else [],
 		)
 
+	def find_unknown_citations(self, text: str) -> set[str]:
+		"""Citation IDs in a (possibly partial) draft that are not in the sources database"""
+		return {c for c in self.citation_pattern.findall(text) if c not in self.sources_db}
+
 	def _check_unearned_claims(
 		self, content: str, project_type: ProjectType, artifacts: list[dict]
 	) -> list[ValidationIssue]:
 		issues = []
 
-		# Convert dict artifacts to Artifact objects for easier type checking
-		[Artifact(id='', type=ArtifactType(a['type']), description=a['description']) for a in artifacts]
-
-		speculative_phrases = [
-			'we conducted',
-			'we measured',
-			'we implemented',
-			'our results',
-			'data was collected',
-			'experiments showed',
-			'our system',
-		]
-
 		if project_type == ProjectType.REVIEW:
-			for phrase in speculative_phrases:
-				if re.search(r'\b' + re.escape(phrase) + r'\b', content, re.IGNORECASE):
+			for phrase, phrase_re, _ in _SPECULATIVE_PHRASES:
+				if phrase_re.search(content):
 					issues.append(
 						ValidationIssue(
 							issue_type=IssueType.UNEARNED_CLAIM,
@@ -115,10 +126,8 @@ class CitationValidator:
 
 		elif project_type == ProjectType.PROPOSAL:
 			# For proposals, we allow future tense, but not past tense claims of execution
-			for phrase in speculative_phrases:
-				if re.search(r'\b' + re.escape(phrase) + r'\b', content, re.IGNORECASE) and not re.search(
-					r'will\s+' + re.escape(phrase.replace('we ', '')), content, re.IGNORECASE
-				):
+			for phrase, phrase_re, future_re in _SPECULATIVE_PHRASES:
+				if phrase_re.search(content) and not future_re.search(content):
 					issues.append(
 						ValidationIssue(
 							issue_type=IssueType.UNEARNED_CLAIM,
@@ -132,8 +141,8 @@ class CitationValidator:
 		elif project_type in [ProjectType.EMPIRICAL, ProjectType.COMPUTATIONAL]:
 			if not artifacts:
 				# If no artifacts, all execution claims are unearned
-				for phrase in speculative_phrases:
-					if re.search(r'\b' + re.escape(phrase) + r'\b', content, re.IGNORECASE):
+				for phrase, phrase_re, _ in _SPECULATIVE_PHRASES:
+					if phrase_re.search(content):
 						issues.append(
 							ValidationIssue(
 								issue_type=IssueType.UNEARNED_CLAIM,
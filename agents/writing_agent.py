@@ -1,9 +1,31 @@
 import re
 import time
+from collections.abc import Generator
 from typing import Any
 
+from utils.citations import CITATION_RE
 from utils.logger import logger
 
+_BRACKET_RE = re.compile(r'\[([^\]]+)\]')
+# [source_id], [source01], [1], [ref_01], [citation], [arxiv]
+_PLACEHOLDER_RE = re.compile(r'source_?\d*|\d+|ref_?\d*|citation|arxiv', re.IGNORECASE)
+
+# Past-tense claims rewritten for proposals; whole-word matches avoid partial replacements
+_PROPOSAL_REPLACEMENTS = {
+	'we conducted': 'we will conduct',
+	'we collected': 'we will collect',
+	'we analyzed': 'we will analyze',
+	'results show': 'expected results will show',
+	'we found': 'we expect to find',
+	'our experiment': 'our proposed experiment',
+	'this study demonstrated': 'this proposed study will demonstrate',
+	'the system performs': 'the proposed system will perform',
+	'we implemented': 'we will implement',
+}
+_PROPOSAL_CLAIM_RE = re.compile(
+	r'\b(?:' + '|'.join(re.escape(old) for old in _PROPOSAL_REPLACEMENTS) + r')\b', re.IGNORECASE
+)
+
 
 class WritingAgent:
 	def __init__(
@@ -28,9 +50,7 @@ class WritingAgent:
 		previous_section_text: str | None = None,
 		avoid_repetition: bool = False,
 	) -> dict[str, Any]:
-		logger.info(f'\n{"=" * 60}')
-		logger.info(f'WRITING: {section_title}')
-		logger.info(f'{"=" * 60}')
+		self._log_header(section_title)
 
 		start_time = time.time()
 
@@ -49,11 +69,49 @@ class WritingAgent:
 
 		try:
 			content = self._generate_content(prompt, constraints)
-			content = self._adjust_claims_for_project_type(content, project_type)
 		except Exception as e:
 			logger.error(f'Content generation failed: {e}')
 			raise
 
+		return self.finalize_content(content, project_type, available_sources, start_time)
+
+	def stream_section(
+		self,
+		section_title: str,
+		section_objective: str,
+		topic: str,
+		project_type: str,
+		artifacts: list[dict],
+		guidance: str,
+		available_sources: list[dict[str, Any]],
+		style_preferences: dict[str, Any],
+		constraints: dict[str, Any],
+		previous_section_text: str | None = None,
+		avoid_repetition: bool = False,
+	) -> Generator[str, None, None]:
+		"""Yield raw section text as it is generated; pass the joined text to finalize_content()"""
+		self._log_header(section_title)
+
+		prompt = self._build_writing_prompt(
+			section_title=section_title,
+			section_objective=section_objective,
+			topic=topic,
+			project_type=project_type,
+			artifacts=artifacts,
+			guidance=guidance,
+			available_sources=available_sources,
+			style_preferences=style_preferences,
+			constraints=constraints,
+			previous_section_text=previous_section_text,
+		)
+
+		yield from self.llm_client.generate_stream(prompt, max_tokens=self._max_tokens(constraints))
+
+	def finalize_content(
+		self, content: str, project_type: str, available_sources: list[dict[str, Any]], start_time: float
+	) -> dict[str, Any]:
+		content = self._adjust_claims_for_project_type(content.strip(), project_type)
+
 		word_count = self._count_words(content)
 		citations_used = self._extract_citations(content)
 		content = self._validate_citations_post_write(content, available_sources)
@@ -72,24 +130,16 @@ class WritingAgent:
 			'generation_time': elapsed,
 		}
 
+	def _log_header(self, section_title: str) -> None:
+		logger.info(f'\n{"=" * 60}')
+		logger.info(f'WRITING: {section_title}')
+		logger.info(f'{"=" * 60}')
+
 	def _adjust_claims_for_project_type(self, content: str, project_type: str) -> str:
 		"""Downgrade false claims based on project type for proposals."""
 		if project_type == 'proposal':
-			replacements = {
-				'we conducted': 'we will conduct',
-				'we collected': 'we will collect',
-				'we analyzed': 'we will analyze',
-				'results show': 'expected results will show',
-				'we found': 'we expect to find',
-				'our experiment': 'our proposed experiment',
-				'this study demonstrated': 'this proposed study will demonstrate',
-				'the system performs': 'the proposed system will perform',
-				'we implemented': 'we will implement',
-			}
-
-			for old, new in replacements.items():
-				# Use regex for whole word matching to avoid partial replacements
-				content = re.sub(r'\b' + re.escape(old) + r'\b', new, content, flags=re.IGNORECASE)
+			# One scan for all phrases instead of one per phrase
+			content = _PROPOSAL_CLAIM_RE.sub(lambda m: _PROPOSAL_REPLACEMENTS[m.group(0).lower()], content)
 
 			logger.info(f'  Claims adjusted for {project_type} project type.')
 
@@ -272,60 +322,39 @@ Write in Markdown. Begin now:"""
 		return instructions
 
 	def _generate_content(self, prompt: str, constraints: dict) -> str:
-		target_words = constraints.get('max_section_word_count', 1500)
-		max_tokens = int(target_words * 1.5)
-		content = self.llm_client.generate(prompt, max_tokens=max_tokens)
+		content = self.llm_client.generate(prompt, max_tokens=self._max_tokens(constraints))
 		return content.strip()
 
+	def _max_tokens(self, constraints: dict) -> int:
+		target_words = constraints.get('max_section_word_count', 1500)
+		return int(target_words * 1.5)
+
 	def _count_words(self, text: str) -> int:
 		words = text.split()
 		return len(words)
 
 	def _extract_citations(self, text: str) -> list[str]:
-		import re
-
-		pattern = r'\[(arxiv:\S+?|doi:\S+?)(?::\s*"[^"]*")?\]'
-		matches = re.findall(pattern, text)
-		return list(set(matches))
+		# Ordered dedup keeps citations in first-use order, stable across runs
+		return list(dict.fromkeys(CITATION_RE.findall(text)))
 
 	def _validate_citations_post_write(self, content: str, available_sources: list) -> str:
 		"""Check for placeholder citations and warn"""
-		import re
-
 		# Find all citations
-		citations = re.findall(r'\[([^\]]+)\]', content)
-
-		placeholder_patterns = [
-			r'^source_?\d*$',  # [source_id], [source01]
-			r'^\d+$',  # [1], [2]
-			r'^ref_?\d*$',  # [ref_01]
-			r'^citation$',  # [citation]
-			r'^arxiv$',  # [arxiv]
-		]
+		citations = _BRACKET_RE.findall(content)
 
 		valid_ids = {s['source_id'] for s in available_sources}
+		quoted_prefixes = tuple(f'{vid}:' for vid in valid_ids)
 
 		warnings = []
 		for citation in citations:
 			citation_clean = citation.strip()
 
 			# 1. Check if it's a valid ID (or starts with one, to handle [ID: "quote"])
-			is_valid = False
-			if citation_clean in valid_ids:
-				is_valid = True
-			else:
-				for vid in valid_ids:
-					if citation_clean.startswith(f'{vid}:'):
-						is_valid = True
-						break
-
-			if is_valid:
+			if citation_clean in valid_ids or citation_clean.startswith(quoted_prefixes):
 				continue
 
 			# 2. Check if it's a placeholder
-			is_placeholder = any(re.match(pattern, citation_clean, re.IGNORECASE) for pattern in placeholder_patterns)
-
-			if is_placeholder:
+			if _PLACEHOLDER_RE.fullmatch(citation_clean):
 				warnings.append(f'Found placeholder citation: [{citation}]')
 				# Remove placeholder from content
 				content = content.replace(f'[{citation}]', '')
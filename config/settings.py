@@ -17,6 +17,8 @@ class Settings(BaseSettings):
 	# App Settings
 	APP_NAME: str = 'Scholarly'
 	LOG_LEVEL: str = 'INFO'
+	# The editor's LLM review is not applied yet, so it only costs a full-paper request
+	EDITOR_LLM_REVIEW: bool = False
 
 	# Paths
 	BASE_DIR: Path = Path(__file__).parent.parent.parent
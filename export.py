@@ -9,15 +9,19 @@ Usage:
     python export.py --format docx      # Only DOCX
 """
 
-import json
 import sys
 from argparse import ArgumentParser
 from pathlib import Path
 
 from agents.export_engine import ExportEngine
 from agents.research_agent import ResearchAgent
+from agents.state_manager import StateManager
+from utils import json_io
 from utils.logger import logger
 
+# The abstract only needs the first few sentences of the introduction
+_ABSTRACT_READ_BYTES = 8192
+
 
 def export_paper(
 	state_dir: Path, formats: tuple[str, ...] = ('pdf', 'docx'), output_dir: Path | None = None
@@ -26,21 +30,23 @@ def export_paper(
 
 	state_file = state_dir / 'state.json'
 	plan_file = state_dir / 'plan.json'
-	sections_dir = state_dir / 'sections'
 
 	# Validate files exist
 	if not state_file.exists():
 		raise FileNotFoundError(f'State file not found: {state_file}')
 	if not plan_file.exists():
 		raise FileNotFoundError(f'Plan file not found: {plan_file}')
-	if not sections_dir.exists() or not list(sections_dir.glob('*.md')):
-		raise FileNotFoundError(f'No sections found in {sections_dir}')
 
 	# Load metadata
-	with open(state_file) as f:
-		state = json.load(f)
-	with open(plan_file) as f:
-		plan = json.load(f)
+	state = json_io.read_json(state_file)
+	state_manager = StateManager(state_dir)
+	plan = state_manager.load_plan()  # Includes journaled section updates
+
+	# Only the plan's own sections, in plan order
+	section_paths = [state_manager.section_file(s['id'], s['title']) for s in plan['sections']]
+	section_files = [path for path in section_paths if path.exists()]
+	if not section_files:
+		raise FileNotFoundError(f'No sections found in {state_manager.sections_dir}')
 
 	# Load sources
 	research_agent = ResearchAgent(storage_dir=state_dir / 'sources')
@@ -57,7 +63,7 @@ def export_paper(
 	metadata = {
 		'topic': state['config']['topic'],
 		'author': state['config'].get('author', 'Anonymous'),
-		'abstract': _generate_abstract(sections_dir, plan['topic']),
+		'abstract': _generate_abstract(section_paths[0] if section_paths else None, plan['topic']),
 		'created_at': state['created_at'],
 		'profile': profile_name,
 	}
@@ -70,7 +76,7 @@ def export_paper(
 
 	# Export
 	outputs = export_engine.export_paper(
-		sections_dir=sections_dir, sources_db=research_agent.sources_db, metadata=metadata, formats=formats
+		section_files=section_files, sources_db=research_agent.sources_db, metadata=metadata, formats=formats
 	)
 
 	logger.info(f'\n{"=" * 60}')
@@ -83,14 +89,13 @@ def export_paper(
 	return outputs
 
 
-def _generate_abstract(sections_dir: Path, topic: str) -> str:
+def _generate_abstract(intro_file: Path | None, topic: str) -> str:
 	"""Generate abstract from introduction or first section"""
-	intro_files = list(sections_dir.glob('00_*.md'))
-
-	if not intro_files:
+	if intro_file is None or not intro_file.exists():
 		return f'This research examines {topic}.'
 
-	content = intro_files[0].read_text(encoding='utf-8')
+	with intro_file.open('rb') as f:
+		content = f.read(_ABSTRACT_READ_BYTES).decode('utf-8', errors='ignore')
 
 	# Remove markdown header
 	if content.startswith('#'):
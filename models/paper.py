@@ -1,5 +1,7 @@
 from dataclasses import dataclass
 from enum import Enum
+from functools import cached_property
+from typing import Any
 
 
 class EvidenceType(Enum):
@@ -63,3 +65,33 @@ class SectionSummary:
 	summary: str
 	key_findings: list[Finding]
 	key_terms: list[str]
+
+	@classmethod
+	def from_checkpoint_payload(cls, section_id: int, payload: dict[str, Any]) -> 'SectionSummary':
+		"""Inverse of checkpoint_payload (key terms are not checkpointed)"""
+		findings = [
+			Finding(text=f['text'], source_ids=f['source_ids'], section_id=section_id)
+			for f in payload.get('key_findings', ())
+		]
+		return cls(section_id, payload['title'], payload['summary'], findings, [])
+
+	@cached_property
+	def checkpoint_payload(self) -> dict[str, Any]:
+		"""Checkpoint form of the summary, built once since the summary is immutable"""
+		return {
+			'title': self.section_title,
+			'summary': self.summary,
+			'key_findings': [{'text': f.text, 'source_ids': f.source_ids} for f in self.key_findings],
+		}
+
+	@cached_property
+	def context_block(self) -> str:
+		"""Prompt form of the summary used as context for later sections"""
+		findings = '\n'.join(f'- {f.text}' for f in self.key_findings)
+		return f"""
+## {self.section_title} (Summary)
+{self.summary}
+
+Key findings:
+{findings}
+"""
@@ -22,13 +22,17 @@ class Section:
 	research_strategy: str = 'global'
 
 
+_DEFAULT_SECTION = Section(SectionType.DISCUSSION, 4)
+
+
 class Profile:
 	def __init__(self, name: str, sections: dict):
 		self.name, self.sections = name, sections
+		self._lowered = tuple((k.lower(), v) for k, v in sections.items())
 
 	def get_section(self, title: str) -> Section:
 		t = title.lower()
-		return next((v for k, v in self.sections.items() if k.lower() in t), Section(SectionType.DISCUSSION, 4))
+		return next((v for k, v in self._lowered if k in t), _DEFAULT_SECTION)
 
 
 def get_base_sections():
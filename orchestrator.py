@@ -1,6 +1,9 @@
-import json
+import hashlib
+import re
 import signal
 import sys
+import threading
+import time
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
@@ -16,11 +19,111 @@ from agents.state_manager import StateManager
 from agents.validation_agent import CitationValidator
 from agents.writing_agent import WritingAgent
 from config.settings import settings
-from models import Finding, Severity
+from models import Finding, SectionSummary, Severity
 from models.template_profile import ProfileManager, Section, SectionType
+from utils import file_io, json_io
 from utils.llm_client import UnifiedLLMClient
 from utils.logger import logger
 
+# Streamed drafts are checked every N chunks (~tokens); a draft running past
+# max_words * _RUNAWAY_WORD_FACTOR is logged once (max_tokens bounds the output).
+_STREAM_CHECK_INTERVAL = 200
+_RUNAWAY_WORD_FACTOR = 1.2
+_CITATION_SCAN_OVERLAP = 512
+
+_PLACEHOLDER_RE = re.compile(r'\[source_?\w*\]', re.IGNORECASE)
+
+# Section title keywords a project type cannot have, with the reason logged when skipping
+_PROPOSAL_FORBIDDEN = ('result', 'finding', 'outcome', 'data analysis')
+_REVIEW_FORBIDDEN = ('methodology', 'experiment', 'procedure')
+_GATES = {
+	'proposal': (_PROPOSAL_FORBIDDEN, 'proposal has no results'),
+	'review': (_REVIEW_FORBIDDEN, 'review has no experiments'),
+}
+_ARTIFACT_GATED = frozenset({'empirical', 'computational'})
+
+# Default section objectives by section type, matched on keywords in the title
+_SECTION_OBJECTIVES = {
+	SectionType.INTRO_CONCLUSION: {
+		'introduction': 'Introduce the research problem, establish context, and state objectives',
+		'background': 'Provide comprehensive background on the domain and establish research context',
+		'statement': 'Clearly define the research problem and its significance',
+		'objective': 'State specific, measurable objectives of the study',
+		'significance': 'Justify the importance and potential impact of the research',
+		'scope': 'Define boundaries and limitations of the study',
+		'summary': 'Recapitulate key findings and their implications',
+		'conclusion': 'Synthesize findings and state final conclusions',
+		'recommendations': 'Provide actionable recommendations based on findings',
+	},
+	SectionType.LITERATURE: {
+		'literature': 'Review and synthesize existing research, identify gaps',
+		'existing': 'Analyze existing approaches and their limitations',
+		'efforts': 'Evaluate prior attempts to address the problem',
+	},
+	SectionType.METHODOLOGY: {
+		'methodology': 'Describe research methods, procedures, and justification',
+		'approach': 'Detail the specific approach and rationale',
+	},
+	SectionType.TECHNICAL: {
+		'analysis': 'Analyze system requirements and constraints',
+		'design': 'Present system architecture and design decisions',
+		'flowchart': 'Illustrate process flows and system logic',
+	},
+	SectionType.IMPLEMENTATION: {
+		'implementation': 'Document implementation details and technical choices',
+		'test': 'Describe testing procedures and results',
+		'documentation': 'Provide technical and user documentation',
+		'maintenance': 'Outline maintenance procedures and support',
+	},
+	SectionType.DISCUSSION: {
+		'findings': 'Present and analyze research findings',
+		'discussion': 'Interpret results and discuss implications',
+		'results': 'Report research outcomes with supporting evidence',
+	},
+}
+
+# (keyword, objective) pairs per type, in the order they are tried
+_OBJECTIVE_TABLE = {section_type: tuple(table.items()) for section_type, table in _SECTION_OBJECTIVES.items()}
+
+# Fixed instructions sent as the system prompt, separate from the per-call data in the user message
+_GLOBAL_OUTLINE_SYSTEM = """You are a senior academic editor. Create a detailed global outline for a research project.
+The user provides the topic, project type, available artifacts and the sections to cover.
+
+Project types: Empirical: user collected data; Computational: user wrote code; Review: literature synthesis only;
+Proposal: future work
+
+# TASK
+For each section, provide 2-3 sentences of specific guidance.
+Ensure:
+1. No circular definitions (don't repeat problem statement in intro AND background).
+2. Epistemic Integrity: If PROJECT TYPE is 'Review' or 'Proposal', FORBID claims of ownership (e.g., no "we measured").
+3. Logical Flow: Each section must build on the previous one.
+4. Content Mapping: Assign specific sub-topics to specific sections so they don't overlap.
+
+# OUTPUT FORMAT
+JSON dictionary where keys are section titles and values are the guidance.
+Only output the JSON."""
+
+_REFINE_OBJECTIVE_SYSTEM = """You are planning an academic paper section.
+
+You are given the paper topic, the section to write, its generic objective and key findings from prior sections.
+Refine the objective so the section builds upon these specific findings.
+Make it concrete and actionable for the writer.
+
+Output only the refined objective (1-2 sentences)."""
+
+_ABSTRACT_SYSTEM = """Generate a 150-200 word academic abstract for the research paper described by the user.
+
+# Abstract Requirements
+- 150-200 words ONLY (strict limit)
+- Include: problem statement, methods, key findings, implications
+- Use past tense ("This research examined...", "Results showed...")
+- No citations in abstract
+- One paragraph, no bullet points
+- Professional academic tone
+
+Write ONLY the abstract, nothing else."""
+
 
 class Orchestrator:
 	def __init__(self, state_dir: Path | str = 'state'):
@@ -38,6 +141,10 @@ class Orchestrator:
 			max_papers_per_section=10,
 		)
 		self._writing_agent = None
+		# Shares sources_db by reference, so gap-filling sources are seen without a rebuild
+		self.validator_agent = CitationValidator(self.research_agent.sources_db)
+		self._section_cache: dict[int, tuple[str, str]] = {}  # id -> (title, content)
+		self._section_files: dict[int, Path] = {}  # Indexed from the plan, never from a directory listing
 		self.llm_client: UnifiedLLMClient = UnifiedLLMClient(
 			client=OpenAI(base_url='https://openrouter.ai/api/v1', api_key=settings.OPENROUTER_API_KEY),
 			model='xiaomi/mimo-v2-flash:free',
@@ -49,17 +156,26 @@ class Orchestrator:
 		self.current_profile = None
 		self.export_engine = None
 
+		self._current_section_id = None
+		self._completed_ids: list[int] | None = None  # Built from the plan on the first checkpoint
+		self._interruption_requested = threading.Event()
+		self._interrupt_signum: int | None = None
+
 		self._setup_signal_handlers()
+		self._state_digest: bytes | None = None
 
-		self._current_section_id = None
-		self._interruption_requested = False
+		# LLM responses for planning prompts, keyed by prompt hash, so re-runs skip repeated calls
+		self.prompt_cache_file = self.state_dir / 'prompt_cache.jsonl'
+		self._prompt_cache = self._load_prompt_cache()
 
 	def initialize(self, input_data: dict[str, Any]) -> None:
+		declined = False
 		if self.state_manager.can_resume():
 			response = input('\n Found incomplete paper. Resume from checkpoint? (y/n): ')
 			if response.lower() == 'y':
 				logger.info('Resuming from checkpoint...')
 				return
+			declined = True
 
 		config = self.validator.validate(input_data)
 		logger.info(f'Input validated. Topic: {config["topic"][:50]}...')
@@ -67,6 +183,18 @@ class Orchestrator:
 		self.current_profile = self.profile_manager.detect(config['template'])
 		logger.info(f'Detected template profile: {self.current_profile.name}')
 
+		run_key = self._compute_run_key(config, self.current_profile.name)
+		if not declined and self._is_same_run(run_key):
+			logger.info(f'Input unchanged since last run ({run_key}), reusing existing plan')
+			return
+
+		# A new plan replaces the old paper, so none of its sections or journals may leak into this one
+		self.state_manager.reset_run()
+		self.research_agent.clear_sources()
+		self._section_cache.clear()
+		self._section_files.clear()
+
+		now = datetime.now(UTC).isoformat()
 		state = {
 			'config': config,
 			'profile_name': self.current_profile.name,
@@ -76,10 +204,10 @@ class Orchestrator:
 			'completed_sections': [],
 			'failed_sections': [],
 			'research_complete': False,
-			'created_at': datetime.now(UTC).isoformat(),
-			'updated_at': datetime.now(UTC).isoformat(),
+			'created_at': now,
+			'updated_at': now,
 		}
-		self._save_state(state)
+		self._save_state(state, updated_at=now)
 		logger.info(f'State initialized at {self.state_file}')
 
 		# Generate Global Outline before creating the plan
@@ -88,15 +216,20 @@ class Orchestrator:
 		self._save_state(state)
 
 		sections = []
+		section_profiles: dict[str, Section] = {}
 		for idx, title in enumerate(config['template']):
-			section_profile = self.current_profile.get_section(title)
+			title_cf = title.casefold()
+			section_profile = section_profiles.get(title)
+			if section_profile is None:
+				section_profile = section_profiles[title] = self.current_profile.get_section(title)
 			section_guidance = global_outline.get(title, '')
 
 			sections.append(
 				{
 					'id': idx,
 					'title': title,
-					'objective': self._generate_objective(title, section_profile),
+					'title_cf': title_cf,
+					'objective': self._generate_objective(title, title_cf, section_profile),
 					'guidance': section_guidance,
 					'status': 'pending',
 					'word_count': 0,
@@ -115,11 +248,14 @@ class Orchestrator:
 			'sections': sections,
 			'total_sections': len(sections),
 			'profile': self.current_profile.name,
-			'created_at': datetime.now(UTC).isoformat(),
+			'run_key': run_key,
+			'created_at': now,
 		}
 		self._save_plan(plan)
+		# Only a completed plan commits the run key, so an interrupted init is never mistaken for this input
+		state['run_key'] = run_key
+		self._save_state(state)
 		logger.info(f'Plan created with {len(sections)} sections')
-		self.state_manager.clear_checkpoint()
 
 	def run(self) -> None:
 		if self.state_manager.can_resume():
@@ -144,7 +280,10 @@ class Orchestrator:
 			plan = self._load_plan()
 			start_section = 0
 
-		if not state.get('research_complete'):
+		self._index_section_files(plan)
+		# Sources from before the registry was persisted don't resolve, so research them again
+		unresolved = any(self.research_agent.get_source(sid) is None for sid in plan.get('global_source_ids', []))
+		if not state.get('research_complete') or unresolved:
 			self._run_global_research(state, plan)
 
 		if self._writing_agent is None:
@@ -152,15 +291,22 @@ class Orchestrator:
 
 		# Process sections
 		for section in plan['sections'][start_section:]:
+			# Reuse sections already validated by a previous run of the same input
+			if section['status'] == 'validated' and self._load_section_content(section['id']) is not None:
+				logger.info(f"Skipping '{section['title']}' (already validated)")
+				self._restore_section_summary(section)
+				continue
+
 			# NEW: Check if section is allowed
 			if not self._gate_section(section, state):
 				section['status'] = 'skipped'
-				self._save_plan(plan)  # Save plan with skipped status
+				self._append_plan_delta(section, 'status')  # Journal skipped status
 				continue
 
 			# Check for interruption
-			if self._interruption_requested:
-				logger.warning('\n  Interruption detected, saving...')
+			if self._interruption_requested.is_set():
+				signal_name = signal.Signals(self._interrupt_signum).name
+				logger.warning(f'\n  Received {signal_name}, saving progress...')
 				self._save_checkpoint(section['id'], state, plan)
 				logger.info('✓ Checkpoint saved. Run again to resume.')
 				sys.exit(0)
@@ -187,6 +333,8 @@ class Orchestrator:
 				if response.lower() != 'y':
 					sys.exit(1)
 
+		# Compact the journal back into plan.json
+		self._save_plan(plan)
 		self.state_manager.clear_checkpoint()
 
 		logger.info('Paper generation complete!')
@@ -198,23 +346,32 @@ class Orchestrator:
 
 		from agents.editor_agent import EditorAgent
 
-		editor = EditorAgent(self.llm_client)
+		editor = EditorAgent(self.llm_client, use_llm=settings.EDITOR_LLM_REVIEW)
 
-		all_section_contents = []
-		for section in plan['sections']:
-			content = self._load_section_content(section['id'])
-			if content:
-				all_section_contents.append(content)
+		contents = self._load_section_contents([section['id'] for section in plan['sections']])
+		written = [(section, content) for section, content in zip(plan['sections'], contents, strict=True) if content]
 
-		edited_contents = editor.remove_redundancy(all_section_contents)
+		edited_contents = editor.remove_redundancy([content for _, content in written])
 
 		# Save edited versions (Note: currently EditorAgent returns original, needs full implementation)
-		for i, section in enumerate(plan['sections']):
-			if i < len(edited_contents):
-				self._save_section_content(section['id'], section['title'], edited_contents[i])
+		for (section, original), edited in zip(written, edited_contents, strict=False):
+			if edited != original:
+				self._save_section_content(section['id'], section['title'], edited)
 
 		self._export_paper(state, plan)
 
+	def _compute_run_key(self, config: dict, profile_name: str) -> str:
+		"""Deterministic hash of everything that shapes the plan"""
+		canonical = json_io.dumps({'config': config, 'profile': profile_name}, indent=False, sort_keys=True)
+		return hashlib.blake2b(canonical, digest_size=8).hexdigest()
+
+	def _is_same_run(self, run_key: str) -> bool:
+		if not (self.state_file.exists() and self.plan_file.exists()):
+			return False
+		# The key is written to the plan, then the state; both must match, and legacy files without it never do
+		plan_key = json_io.read_json(self.plan_file).get('run_key')
+		return plan_key == run_key and self._load_state().get('run_key') == run_key
+
 	def _run_global_research(self, state: dict, plan: dict) -> None:
 		logger.info(f'\n{"=" * 60}')
 		logger.info('PHASE 2: GLOBAL RESEARCH')
@@ -238,165 +395,106 @@ class Orchestrator:
 	def _gate_section(self, section: dict, state: dict) -> bool:
 		"""Returns False if section should be skipped"""
 		project_type = state['project_type']
-		section_title = section['title'].lower()
+		gate = _GATES.get(project_type)
+		if gate is None and project_type not in _ARTIFACT_GATED:
+			return True
 
-		# Rule 1: Proposals cannot have Results
-		if project_type == 'proposal' and any(
-			keyword in section_title for keyword in ['result', 'finding', 'outcome', 'data analysis']
-		):
-			logger.warning(f"Skipping '{section['title']}' (proposal has no results)")
-			return False
+		section_title = section.get('title_cf') or section['title'].casefold()
 
-		# Rule 2: Reviews cannot have Methodology (for original work)
-		if project_type == 'review' and any(
-			keyword in section_title for keyword in ['methodology', 'experiment', 'procedure']
-		):
-			logger.warning(f"Skipping '{section['title']}' (review has no experiments)")
-			return False
+		# Rules 1-2: Proposals cannot have Results, Reviews cannot have Methodology (for original work)
+		if gate is not None:
+			forbidden, reason = gate
+			if any(keyword in section_title for keyword in forbidden):
+				logger.warning(f"Skipping '{section['title']}' ({reason})")
+				return False
+			return True
 
 		# Rule 3: Empirical/Computational require artifacts for Results
-		if project_type in ['empirical', 'computational'] and 'result' in section_title:
-			has_artifacts = len(state.get('artifacts', [])) > 0
-			if not has_artifacts:
-				logger.error(f"Cannot write '{section['title']}'—no artifacts provided!")
-				return False
+		if 'result' in section_title and not state.get('artifacts'):
+			logger.error(f"Cannot write '{section['title']}'—no artifacts provided!")
+			return False
 
 		return True
 
 	def _save_checkpoint(self, current_section_id: int, state: dict, plan: dict) -> None:
-		completed = [s['id'] for s in plan['sections'] if s['status'] in ['validated', 'drafted']]
+		if self._completed_ids is None:
+			self._completed_ids = [s['id'] for s in plan['sections'] if s['status'] in ['validated', 'drafted']]
 
 		context_summaries = {}
 		if hasattr(self, 'context_manager'):
-			for summary in self.context_manager.summaries:
-				context_summaries[summary.section_id] = {
-					'title': summary.section_title,
-					'summary': summary.summary,
-					'key_findings': [{'text': f.text, 'source_ids': f.source_ids} for f in summary.key_findings],
-				}
+			context_summaries = {
+				summary.section_id: summary.checkpoint_payload for summary in self.context_manager.summaries
+			}
 
 		self.state_manager.save_checkpoint(
-			current_section_id=current_section_id + 1, completed_sections=completed, context_summaries=context_summaries
+			current_section_id=current_section_id + 1,
+			completed_sections=self._completed_ids,
+			context_summaries=context_summaries,
 		)
 
 	def _restore_context_cache(self, context_cache: dict) -> None:
 		if not context_cache or not hasattr(self, 'context_manager'):
 			return
 
-		from models import Finding, SectionSummary
-
 		for section_id_str, cache_data in context_cache.items():
-			section_id = int(section_id_str)
-
-			findings = [
-				Finding(text=f['text'], source_ids=f['source_ids'], section_id=section_id)
-				for f in cache_data.get('key_findings', [])
-			]
-
-			summary = SectionSummary(
-				section_id=section_id,
-				section_title=cache_data['title'],
-				summary=cache_data['summary'],
-				key_findings=findings,
-				key_terms=[],
-			)
-
-			self.context_manager.summaries.append(summary)
+			summary = SectionSummary.from_checkpoint_payload(int(section_id_str), cache_data)
+			self.context_manager.add_summary(summary)
 
 		logger.info(f'✓ Restored {len(context_cache)} summaries from cache')
 
+	def _restore_section_summary(self, section: dict) -> None:
+		"""Re-register a skipped section's summary so later sections keep their prior context"""
+		if 'summary' not in section or self.context_manager.has_summary(section['id']):
+			return
+		payload = {
+			'title': section['title'],
+			'summary': section['summary'],
+			'key_findings': section.get('key_findings', []),
+		}
+		self.context_manager.add_summary(SectionSummary.from_checkpoint_payload(section['id'], payload))
+
 	def _generate_global_outline(self, config: dict) -> dict[str, str]:
 		logger.info('Generating global outline for cohesive narrative...')
 
-		sections_list = '\n'.join([f'- {s}' for s in config['template']])
-		artifacts_text = '\n'.join([f'- {a["type"]}: {a["description"]}' for a in config.get('artifacts', [])])
-
-		prompt = f"""You are a senior academic editor. Create a detailed global outline for a research project.
+		sections_list = '\n'.join(f'- {s}' for s in config['template'])
+		artifacts_text = '\n'.join(f'- {a["type"]}: {a["description"]}' for a in config.get('artifacts', []))
 
-# TOPIC
+		prompt = f"""# TOPIC
 {config['topic']}
 
 # PROJECT TYPE
 {config['project_type']}
-(Empirical: user collected data; Computational: user wrote code; Review: literature synthesis only; 
-Proposal: future work)
 
 # AVAILABLE ARTIFACTS (EVIDENCE OF WORK DONE)
 {artifacts_text if artifacts_text else 'NONE - NO ORIGINAL WORK PERFORMED'}
 
 # SECTIONS TO COVER
 {sections_list}
-
-# TASK
-For each section, provide 2-3 sentences of specific guidance. 
-Ensure:
-1. No circular definitions (don't repeat problem statement in intro AND background).
-2. Epistemic Integrity: If PROJECT TYPE is 'Review' or 'Proposal', FORBID claims of ownership (e.g., no "we measured").
-3. Logical Flow: Each section must build on the previous one.
-4. Content Mapping: Assign specific sub-topics to specific sections so they don't overlap.
-
-# OUTPUT FORMAT
-JSON dictionary where keys are section titles and values are the guidance.
-Only output the JSON.
 """
+		cache_key = self._prompt_key(prompt, _GLOBAL_OUTLINE_SYSTEM, 2000)
+		cached = self._prompt_cache.get(cache_key)
+		if cached is not None:
+			logger.info('Reusing cached global outline')
+			return json_io.loads(cached)
+
 		try:
-			response = self.llm_client.generate(prompt, max_tokens=2000)
+			response = self.llm_client.generate(prompt, max_tokens=2000, system=_GLOBAL_OUTLINE_SYSTEM)
 			# Strip markdown if any
 			if '```json' in response:
 				response = response.split('```json')[1].split('```')[0].strip()
 			elif '```' in response:
 				response = response.split('```')[1].split('```')[0].strip()
 
-			return json.loads(response)
+			outline = json_io.loads(response)
+			self._store_prompt_result(cache_key, response)
+			return outline
 		except Exception as e:
 			logger.error(f'Global outline generation failed: {e}')
 			return {title: 'Standard academic coverage' for title in config['template']}
 
-	def _generate_objective(self, title: str, profile: Section) -> str:
-		objectives = {
-			SectionType.INTRO_CONCLUSION: {
-				'introduction': 'Introduce the research problem, establish context, and state objectives',
-				'background': 'Provide comprehensive background on the domain and establish research context',
-				'statement': 'Clearly define the research problem and its significance',
-				'objective': 'State specific, measurable objectives of the study',
-				'significance': 'Justify the importance and potential impact of the research',
-				'scope': 'Define boundaries and limitations of the study',
-				'summary': 'Recapitulate key findings and their implications',
-				'conclusion': 'Synthesize findings and state final conclusions',
-				'recommendations': 'Provide actionable recommendations based on findings',
-			},
-			SectionType.LITERATURE: {
-				'literature': 'Review and synthesize existing research, identify gaps',
-				'existing': 'Analyze existing approaches and their limitations',
-				'efforts': 'Evaluate prior attempts to address the problem',
-			},
-			SectionType.METHODOLOGY: {
-				'methodology': 'Describe research methods, procedures, and justification',
-				'approach': 'Detail the specific approach and rationale',
-			},
-			SectionType.TECHNICAL: {
-				'analysis': 'Analyze system requirements and constraints',
-				'design': 'Present system architecture and design decisions',
-				'flowchart': 'Illustrate process flows and system logic',
-			},
-			SectionType.IMPLEMENTATION: {
-				'implementation': 'Document implementation details and technical choices',
-				'test': 'Describe testing procedures and results',
-				'documentation': 'Provide technical and user documentation',
-				'maintenance': 'Outline maintenance procedures and support',
-			},
-			SectionType.DISCUSSION: {
-				'findings': 'Present and analyze research findings',
-				'discussion': 'Interpret results and discuss implications',
-				'results': 'Report research outcomes with supporting evidence',
-			},
-		}
-
-		title_lower = title.lower()
-		section_objectives = objectives.get(profile.type, {})
-
-		for keyword, objective in section_objectives.items():
-			if keyword in title_lower:
+	def _generate_objective(self, title: str, title_cf: str, profile: Section) -> str:
+		for keyword, objective in _OBJECTIVE_TABLE.get(profile.type, ()):
+			if keyword in title_cf:
 				return objective
 
 		return f'Address the requirements of the {title} section'
@@ -409,9 +507,7 @@ Only output the JSON.
 
 		findings_text = '\n'.join(f'- {f.text}' for f in prior_findings)
 
-		prompt = f"""You are planning an academic paper section.
-
-# Paper Topic
+		prompt = f"""# Paper Topic
 {topic}
 
 # Section to Write
@@ -424,15 +520,29 @@ Only output the JSON.
 {findings_text}
 
 # Task
-Refine the objective for "{section_title}" to build upon these specific findings.
-Make it concrete and actionable for the writer.
+Refine the objective for "{section_title}" to build upon these specific findings."""
 
-Output only the refined objective (1-2 sentences)."""
-
-		refined = self.llm_client.generate(prompt, max_tokens=200).strip()
+		refined = self.llm_client.generate(prompt, max_tokens=200, system=_REFINE_OBJECTIVE_SYSTEM).strip()
 		logger.info(f'  Objective refined: {initial_objective} → {refined}')
 		return refined
 
+	def _prompt_key(self, prompt: str, system: str = '', max_tokens: int = 0) -> str:
+		key = f'{self.llm_client.model}\x00{max_tokens}\x00{system}\x00{prompt}'
+		return hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+
+	def _load_prompt_cache(self) -> dict[str, str]:
+		cache: dict[str, str] = {}
+		if self.prompt_cache_file.exists():
+			for cache_key, response in json_io.read_jsonl(self.prompt_cache_file):
+				cache[cache_key] = response
+		return cache
+
+	def _store_prompt_result(self, cache_key: str, response: str) -> None:
+		# Append one record rather than rewriting the whole cache on every store
+		self._prompt_cache[cache_key] = response
+		with open(self.prompt_cache_file, 'ab') as f:
+			f.write(json_io.dumps([cache_key, response], indent=False) + b'\n')
+
 	def _process_section_with_gap_detection(self, section: dict, state: dict, plan: dict) -> None:
 		section_id = section['id']
 		# 1. Refine objective based on prior findings
@@ -474,7 +584,7 @@ Output only the refined objective (1-2 sentences)."""
 			prior_findings=intro_findings,
 		)
 		section['objective'] = refined
-		self._save_plan(plan)
+		self._append_plan_delta(section, 'objective')
 
 	def _get_section_config(self, section: dict) -> dict:
 		"""Extract section configuration"""
@@ -518,27 +628,12 @@ Output only the refined objective (1-2 sentences)."""
 			# Get context from previous section
 			section_id = section['id']
 			previous_context = self._get_previous_context(section_id)
+			validator = self.validator_agent
 
 			# Write section
-			result = self._writing_agent.write_section(  # type: ignore
-				section_title=section['title'],
-				section_objective=section['objective'],
-				topic=state['config']['topic'],
-				project_type=state['project_type'],
-				artifacts=state.get('artifacts', []),
-				guidance=section.get('guidance', ''),
-				available_sources=sources,
-				style_preferences=state['config']['style'],
-				constraints={
-					'max_section_word_count': config['max_words'],
-					'min_citations_per_section': config['min_citations'],
-				},
-				previous_section_text=previous_context,
-				avoid_repetition=(section_id > 3),  # Only for later sections
-			)
+			result = self._stream_section(section, state, sources, config, previous_context, validator)
 
 			# Validate
-			validator = CitationValidator(self.research_agent.sources_db)
 			validation = validator.validate_section(
 				section_id=section_id,
 				content=result['content'],
@@ -567,6 +662,73 @@ Output only the refined objective (1-2 sentences)."""
 			logger.error(f'  Writing failed (attempt {attempt}): {e}')
 			return 'failed'
 
+	def _stream_section(
+		self,
+		section: dict,
+		state: dict,
+		sources: list,
+		config: dict,
+		previous_context: str | None,
+		validator: CitationValidator,
+	) -> dict:
+		"""Stream the draft, checking citations and length on the rolling buffer"""
+		start_time = time.time()
+		word_limit = config['max_words'] * _RUNAWAY_WORD_FACTOR
+
+		stream = self._writing_agent.stream_section(  # type: ignore
+			section_title=section['title'],
+			section_objective=section['objective'],
+			topic=state['config']['topic'],
+			project_type=state['project_type'],
+			artifacts=state.get('artifacts', []),
+			guidance=section.get('guidance', ''),
+			available_sources=sources,
+			style_preferences=state['config']['style'],
+			constraints={
+				'max_section_word_count': config['max_words'],
+				'min_citations_per_section': config['min_citations'],
+			},
+			previous_section_text=previous_context,
+			avoid_repetition=(section['id'] > 3),  # Only for later sections
+		)
+
+		chunks: list[str] = []
+		buffer = ''
+		word_count = 0
+		scanned = 0
+		flagged: set[str] = set()
+		overlong = False
+		try:
+			for count, chunk in enumerate(stream, 1):
+				if count == 1:
+					logger.debug(f'  First token after {time.time() - start_time:.1f}s')
+				chunks.append(chunk)
+				if count % _STREAM_CHECK_INTERVAL:
+					continue
+
+				# Only the text since the last check is joined and counted
+				new_text = ''.join(chunks)
+				chunks.clear()
+				word_count += len(new_text.split())
+				if buffer[-1:].strip() and new_text[:1].strip():
+					word_count -= 1  # A word straddling the boundary was counted twice
+				buffer += new_text
+
+				for citation in validator.find_unknown_citations(buffer[scanned:]) - flagged:
+					logger.warning(f'  Unknown citation in draft: {citation}')
+					flagged.add(citation)
+				scanned = max(0, len(buffer) - _CITATION_SCAN_OVERLAP)
+
+				logger.debug(f'  Streamed ~{word_count} words in {time.time() - start_time:.1f}s')
+				if word_count > word_limit and not overlong:
+					logger.warning(f'  Draft running long: ~{word_count} words (limit {config["max_words"]})')
+					overlong = True
+		finally:
+			stream.close()
+		buffer += ''.join(chunks)
+
+		return self._writing_agent.finalize_content(buffer, state['project_type'], sources, start_time)  # type: ignore
+
 	def _get_previous_context(self, section_id: int) -> str | None:
 		if section_id == 0:
 			return None
@@ -608,13 +770,17 @@ Output only the refined objective (1-2 sentences)."""
 				sources_used=result['citations_used'],
 			)
 			section['summary'] = summary.summary
+			section['key_findings'] = summary.checkpoint_payload['key_findings']
 
 		# Update metadata
 		section['status'] = 'validated'
+		if self._completed_ids is not None:
+			self._completed_ids.append(section_id)
 		section['word_count'] = result['word_count']
 		section['citations_count'] = len(result['citations_used'])
-		section['completed_at'] = datetime.now().isoformat()
-		self._save_plan(plan)
+		section['completed_at'] = datetime.now(UTC).isoformat()
+		fields = ('summary', 'key_findings', 'status', 'word_count', 'citations_count', 'completed_at')
+		self._append_plan_delta(section, *(field for field in fields if field in section))
 
 		logger.info(f'  ✓ Section validated (attempt {attempt})')
 
@@ -622,7 +788,7 @@ Output only the refined objective (1-2 sentences)."""
 		"""Mark section as failed after all retries"""
 		section['status'] = 'failed'
 		state['failed_sections'].append(section['id'])
-		self._save_plan(plan)
+		self._append_plan_delta(section, 'status')
 		self._save_state(state)
 		logger.error(f'  ✗ Section failed after {section.get("max_retries", 3)} attempts')
 
@@ -648,10 +814,18 @@ Output only the refined objective (1-2 sentences)."""
 			}
 
 			outputs = self.export_engine.export_paper(
-				sections_dir=self.sections_dir,
+				section_files=[
+					self._section_files[s['id']] for s in plan['sections'] if s['id'] in self._section_files
+				],
 				sources_db=self.research_agent.sources_db,
 				metadata=metadata,
 				formats=('pdf', 'docx'),
+				# The editor pass already loaded every section, so export doesn't read them again
+				section_texts={
+					path: self._section_cache[section_id][1]
+					for section_id, path in self._section_files.items()
+					if section_id in self._section_cache
+				},
 			)
 
 			logger.info('✓ Export complete:')
@@ -665,26 +839,25 @@ Output only the refined objective (1-2 sentences)."""
 			logger.warning('Paper sections saved in markdown format in state/sections/')
 
 	def _generate_abstract(self, plan: dict) -> str:
-		intro_file = self.sections_dir / '00_introduction.md'
-		methodology_files = list(self.sections_dir.glob('*methodology*.md')) + list(
-			self.sections_dir.glob('*system_analysis*.md')
-		)
-		findings_files = (
-			list(self.sections_dir.glob('*findings*.md'))
-			+ list(self.sections_dir.glob('*results*.md'))
-			+ list(self.sections_dir.glob('*implementation*.md'))
-		)
-		conclusion_files = list(self.sections_dir.glob('*conclusion*.md'))
+		intro_text = methodology_text = findings_text = conclusion_text = ''
+		contents = self._load_section_contents([section['id'] for section in plan['sections']])
+		for section, content in zip(plan['sections'], contents, strict=True):
+			if content is None:
+				continue
 
-		intro_text = intro_file.read_text()[:800] if intro_file.exists() else ''
-		methodology_text = methodology_files[0].read_text()[:600] if methodology_files else ''
-		findings_text = findings_files[0].read_text()[:600] if findings_files else ''
-		conclusion_text = conclusion_files[0].read_text()[:600] if conclusion_files else ''
+			# Match on the same names the section files are saved under
+			safe_title = StateManager.safe_title(section['title'])
+			if section['id'] == 0 and safe_title == 'introduction':
+				intro_text = self._excerpt(section['title'], content, 800)
+			if not methodology_text and any(k in safe_title for k in ('methodology', 'system_analysis')):
+				methodology_text = self._excerpt(section['title'], content, 600)
+			if not findings_text and any(k in safe_title for k in ('findings', 'results', 'implementation')):
+				findings_text = self._excerpt(section['title'], content, 600)
+			if not conclusion_text and 'conclusion' in safe_title:
+				conclusion_text = self._excerpt(section['title'], content, 600)
 
 		# Generate abstract using LLM
-		prompt = f"""Generate a 150-200 word academic abstract for this research paper.
-
-	# Paper Topic
+		prompt = f"""# Paper Topic
 	{plan['topic']}
 
 	# Introduction (excerpt)
@@ -697,20 +870,16 @@ Output only the refined objective (1-2 sentences)."""
 	{findings_text}
 
 	# Conclusion (excerpt)
-	{conclusion_text}
-
-	# Abstract Requirements
-	- 150-200 words ONLY (strict limit)
-	- Include: problem statement, methods, key findings, implications
-	- Use past tense ("This research examined...", "Results showed...")
-	- No citations in abstract
-	- One paragraph, no bullet points
-	- Professional academic tone
-
-	Write ONLY the abstract, nothing else:"""
+	{conclusion_text}"""
 
 		try:
-			abstract = self.llm_client.generate(prompt, max_tokens=300).strip()
+			cache_key = self._prompt_key(prompt, _ABSTRACT_SYSTEM, 300)
+			abstract = self._prompt_cache.get(cache_key)
+			if abstract is None:
+				abstract = self.llm_client.generate(prompt, max_tokens=300, system=_ABSTRACT_SYSTEM).strip()
+				# Only abstracts that pass the length check are reused by later runs
+				if len(abstract.split()) >= 100:
+					self._store_prompt_result(cache_key, abstract)
 
 			word_count = len(abstract.split())
 			if word_count < 100:
@@ -726,70 +895,94 @@ Output only the refined objective (1-2 sentences)."""
 
 	def _setup_signal_handlers(self) -> None:
 		def signal_handler(signum, frame):
-			signal_name = signal.Signals(signum).name
-			logger.warning(f'\n\n Received {signal_name} - saving progress...')
-			self._interruption_requested = True
-
-			if self._current_section_id is not None:
-				logger.info(f'Finishing section {self._current_section_id} before exit...')
+			# Only set the flag: logging here could deadlock on the logger's lock
+			self._interrupt_signum = signum
+			self._interruption_requested.set()
 
 		signal.signal(signal.SIGINT, signal_handler)
 		signal.signal(signal.SIGTERM, signal_handler)
 
-	def _save_state(self, state: dict) -> None:
-		state['updated_at'] = datetime.now(UTC).isoformat()
-		with open(self.state_file, 'w') as f:
-			json.dump(state, f, indent=2)
+	def _save_state(self, state: dict, updated_at: str | None = None) -> None:
+		# Skip the write (and the updated_at bump) when nothing but updated_at would change
+		content = {k: v for k, v in state.items() if k != 'updated_at'}
+		digest = hashlib.blake2b(json_io.dumps(content, indent=False, sort_keys=True), digest_size=16).digest()
+		if digest == self._state_digest:
+			return
+		self._state_digest = digest
+
+		state['updated_at'] = updated_at or datetime.now(UTC).isoformat()
+		json_io.write_json(self.state_file, state, fsync=True)
 
 	def _load_state(self) -> dict:
-		with open(self.state_file) as f:
-			return json.load(f)
+		return json_io.read_json(self.state_file)
 
 	def _save_plan(self, plan: dict) -> None:
-		with open(self.plan_file, 'w') as f:
-			json.dump(plan, f, indent=2)
+		self.state_manager.save_plan(plan)
 
 	def _load_plan(self) -> dict:
-		with open(self.plan_file) as f:
-			return json.load(f)
+		return self.state_manager.load_plan()
+
+	def _append_plan_delta(self, section: dict, *fields: str) -> None:
+		self.state_manager.append_plan_delta(section['id'], {field: section[field] for field in fields})
+
+	def _index_section_files(self, plan: dict) -> None:
+		self._section_files = {
+			section['id']: path
+			for section in plan['sections']
+			if (path := self.state_manager.section_file(section['id'], section['title'])).exists()
+		}
 
 	def _save_section_content(self, section_id: int, section_title: str, content: str) -> None:
-		# Sanitize filename by replacing spaces and slashes
-		safe_title = section_title.lower().replace(' ', '_').replace('/', '_')
-		filename = f'{section_id:02d}_{safe_title}.md'
-		filepath = self.sections_dir / filename
-		with open(filepath, 'w') as f:
-			f.write(f'# {section_title}\n\n{content}')
+		self._section_cache[section_id] = (section_title, content)
+		filepath = self.state_manager.section_file(section_id, section_title)
+		self._section_files[section_id] = filepath
+		file_io.write_bytes(filepath, f'# {section_title}\n\n{content}'.encode(), fsync=True)
 
 	def _load_section_content(self, section_id: int) -> str | None:
-		files = list(self.sections_dir.glob(f'{section_id:02d}_*.md'))
-		if not files:
+		cached = self._section_cache.get(section_id)
+		if cached is not None:
+			return cached[1] or None
+
+		filepath = self._section_files.get(section_id)
+		if filepath is None:
 			return None
-		with open(files[0]) as f:
-			lines = f.readlines()
-			return ''.join(lines[2:]) if len(lines) > 2 else None
+		with open(filepath, encoding='utf-8') as f:
+			title = f.readline().removeprefix('# ').rstrip('\n')
+			f.readline()
+			content = f.read()
+		self._section_cache[section_id] = (title, content)
+		return content or None
+
+	def _load_section_contents(self, section_ids: list[int]) -> list[str | None]:
+		# Most sections are already cached; the rest are small local files, so a plain loop suffices
+		return [self._load_section_content(section_id) for section_id in section_ids]
+
+	@staticmethod
+	def _excerpt(section_title: str, content: str, n: int) -> str:
+		# Slice before formatting so long sections are never copied whole
+		return f'# {section_title}\n\n{content[:n]}'[:n]
 
 	def _generate_quality_report(self, plan: dict) -> None:
 		metrics = {
 			'total_sections': len(plan['sections']),
-			'validated_sections': sum(1 for s in plan['sections'] if s['status'] == 'validated'),
-			'total_words': sum(s.get('word_count', 0) for s in plan['sections']),
-			'total_citations': sum(s.get('citations_count', 0) for s in plan['sections']),
+			'validated_sections': 0,
+			'total_words': 0,
+			'total_citations': 0,
 			'avg_citations_per_section': 0.0,
 			'sections_under_min_words': 0,
 			'sections_over_max_words': 0,
 			'sections_with_placeholders': 0,
 		}
 
-		if metrics['validated_sections'] > 0:
-			metrics['avg_citations_per_section'] = metrics['total_citations'] / metrics['validated_sections']
-
-		# Check word count compliance
+		# Totals and word count compliance in one pass over the plan
 		for section in plan['sections']:
+			word_count = section.get('word_count', 0)
+			metrics['total_words'] += word_count
+			metrics['total_citations'] += section.get('citations_count', 0)
 			if section['status'] != 'validated':
 				continue
 
-			word_count = section.get('word_count', 0)
+			metrics['validated_sections'] += 1
 			min_words = section.get('min_words', 0)
 			max_words = section.get('max_words', 1500)
 
@@ -798,12 +991,12 @@ Output only the refined objective (1-2 sentences)."""
 			if word_count > max_words * 1.2:  # 20% over
 				metrics['sections_over_max_words'] += 1
 
-		# Check for placeholder citations in saved sections
-		import re
+		if metrics['validated_sections'] > 0:
+			metrics['avg_citations_per_section'] = metrics['total_citations'] / metrics['validated_sections']
 
-		for section_file in self.sections_dir.glob('*.md'):
-			content = section_file.read_text()
-			if re.search(r'\[source_?\w*\]', content, re.IGNORECASE):
+		# Check for placeholder citations in saved sections
+		for content in self._load_section_contents(list(self._section_files)):
+			if content and _PLACEHOLDER_RE.search(content):
 				metrics['sections_with_placeholders'] += 1
 
 		# Calculate estimated page count
@@ -840,11 +1033,8 @@ Output only the refined objective (1-2 sentences)."""
 		logger.info(f'{"=" * 60}\n')
 
 		# Save metrics to file
-		import json
-
 		metrics_file = self.state_dir / 'quality_metrics.json'
-		with open(metrics_file, 'w') as f:
-			json.dump(metrics, f, indent=2)
+		json_io.write_json(metrics_file, metrics)
 
 		logger.info(f'Quality metrics saved to: {metrics_file}')
 
@@ -1,9 +1,9 @@
-import json
 import sys
 from pathlib import Path
 
 from agents.input_validator import ValidationError
 from orchestrator import Orchestrator
+from utils import json_io
 from utils.logger import logger
 
 
@@ -21,9 +21,8 @@ def main():
 		sys.exit(1)
 
 	try:
-		with open(input_file) as f:
-			input_data = json.load(f)
-	except json.JSONDecodeError as e:
+		input_data = json_io.read_json(input_file)
+	except ValueError as e:  # json.JSONDecodeError and orjson.JSONDecodeError both subclass it
 		print(f'Error: Invalid JSON in {input_file}')
 		print(f'  {e}')
 		sys.exit(1)
@@ -39,7 +38,9 @@ def main():
 			logger.info('=' * 60)
 			logger.info('PHASE 1: INITIALIZATION')
 			logger.info('=' * 60)
-			orchestrator.initialize(input_data)
+
+		# Re-initializes only if the input changed since the stored run
+		orchestrator.initialize(input_data)
 
 		logger.info('\n' + '=' * 60)
 		logger.info('PHASE 2: EXECUTION')
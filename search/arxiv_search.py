@@ -1,11 +1,13 @@
 import time
 from pathlib import Path
-
-import arxiv
+from typing import TYPE_CHECKING
 
 from models import CitationReference, SearchResult
 from utils.logger import logger
 
+if TYPE_CHECKING:
+	import arxiv
+
 
 class ArxivSearch:
 	def __init__(self, download_dir: Path | str | None = None):
@@ -17,6 +19,9 @@ class ArxivSearch:
 	def search(self, query: str, max_results: int = 10) -> list[SearchResult]:
 		logger.info(f"Searching arXiv for: '{query}' (max {max_results} results)")
 
+		# Imported on first search so CLIs that never search (e.g. export.py) skip its load time
+		import arxiv
+
 		time.sleep(3)
 
 		client = arxiv.Client(delay_seconds=3, num_retries=3)
@@ -61,7 +66,7 @@ class ArxivSearch:
 	def supports_full_text(self) -> bool:
 		return True
 
-	def _download_pdf(self, paper: arxiv.Result, arxiv_id: str) -> Path | None:
+	def _download_pdf(self, paper: 'arxiv.Result', arxiv_id: str) -> Path | None:
 		try:
 			filename = f'{arxiv_id}.pdf'
 			filepath = self.download_dir / filename  # type: ignore
@@ -78,7 +83,7 @@ class ArxivSearch:
 			logger.warning(f'Failed to download PDF for {arxiv_id}: {e}')
 			return None
 
-	def _extract_citations(self, paper: arxiv.Result) -> list[CitationReference]:
+	def _extract_citations(self, paper: 'arxiv.Result') -> list[CitationReference]:
 		"""
 		Extract citation references from paper.
 
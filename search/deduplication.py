@@ -1,10 +1,18 @@
 from collections.abc import Sequence
 from difflib import SequenceMatcher
+from typing import NamedTuple
 
 from models import CitationReference, SearchResult
 from utils.logger import logger
 
 
+class _DedupKey(NamedTuple):
+	arxiv_id: str | None
+	doi: str | None
+	year: int | None
+	title: str  # lowercased, whitespace-collapsed
+
+
 class PaperDeduplicator:
 	def __init__(self, title_similarity_threshold: float = 0.85):
 		self.title_similarity_threshold = title_similarity_threshold
@@ -15,6 +23,9 @@ class PaperDeduplicator:
 
 		logger.info(f'Deduplicating {len(results)} search results...')
 
+		# Identifiers and normalized titles are built once per result, not once per pair
+		keys = [self._dedup_key(result) for result in results]
+
 		merged_indices = set()
 		unique_results: list[SearchResult] = []
 
@@ -28,7 +39,7 @@ class PaperDeduplicator:
 				if j in merged_indices:
 					continue
 
-				if self._are_duplicates(result_a, result_b):
+				if self._are_duplicates(keys[i], keys[j]):
 					duplicates.append(result_b)
 					merged_indices.add(j)
 
@@ -42,17 +53,21 @@ class PaperDeduplicator:
 
 		return unique_results
 
-	def _are_duplicates(self, a: SearchResult, b: SearchResult) -> bool:
-		arxiv_id_a = self._extract_arxiv_id(a)
-		arxiv_id_b = self._extract_arxiv_id(b)
-		if arxiv_id_a and arxiv_id_b and arxiv_id_a == arxiv_id_b:
-			logger.debug(f'Duplicate found (arXiv): {arxiv_id_a}')
+	def _dedup_key(self, result: SearchResult) -> _DedupKey:
+		return _DedupKey(
+			arxiv_id=self._extract_arxiv_id(result),
+			doi=self._extract_doi(result),
+			year=result.year,
+			title=' '.join(result.title.lower().split()),
+		)
+
+	def _are_duplicates(self, a: _DedupKey, b: _DedupKey) -> bool:
+		if a.arxiv_id and b.arxiv_id and a.arxiv_id == b.arxiv_id:
+			logger.debug(f'Duplicate found (arXiv): {a.arxiv_id}')
 			return True
 
-		doi_a = self._extract_doi(a)
-		doi_b = self._extract_doi(b)
-		if doi_a and doi_b and doi_a == doi_b:
-			logger.debug(f'Duplicate found (DOI): {doi_a}')
+		if a.doi and b.doi and a.doi == b.doi:
+			logger.debug(f'Duplicate found (DOI): {a.doi}')
 			return True
 
 		if a.year and b.year and a.year == b.year:
@@ -120,10 +135,14 @@ class PaperDeduplicator:
 		return None
 
 	def _title_similarity(self, title_a: str, title_b: str) -> float:
-		a = ' '.join(title_a.lower().split())
-		b = ' '.join(title_b.lower().split())
-
-		return SequenceMatcher(None, a, b).ratio()
+		"""Similarity of two normalized titles; cheap upper bounds skip the full ratio for clear mismatches"""
+		matcher = SequenceMatcher(None, title_a, title_b)
+		upper_bound = matcher.real_quick_ratio()
+		if upper_bound >= self.title_similarity_threshold:
+			upper_bound = matcher.quick_ratio()
+		if upper_bound < self.title_similarity_threshold:
+			return upper_bound
+		return matcher.ratio()
 
 	def _merge_authors(self, results: list[SearchResult]) -> list[str] | None:
 		all_authors = []
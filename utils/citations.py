@@ -0,0 +1,4 @@
+import re
+
+# [arxiv:ID] / [doi:ID], optionally followed by a quoted title; shared by the writer and the validator
+CITATION_RE = re.compile(r'\[(arxiv:\S+?|doi:\S+?)(?::\s*"[^"]*")?\]')
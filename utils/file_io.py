@@ -0,0 +1,13 @@
+import os
+from pathlib import Path
+
+
+def write_bytes(path: Path, data: bytes, fsync: bool = False) -> None:
+	# Atomic write (write to temp, then rename); fsync for files a checkpoint relies on
+	temp_file = path.with_suffix(path.suffix + '.tmp')
+	with open(temp_file, 'wb') as f:
+		f.write(data)
+		if fsync:
+			f.flush()
+			os.fsync(f.fileno())
+	temp_file.replace(path)
@@ -0,0 +1,60 @@
+import json
+from pathlib import Path
+from typing import Any
+
+from utils.file_io import write_bytes
+
+try:
+	import orjson
+except ImportError:  # stdlib fallback
+	orjson = None
+
+
+def dumps(obj: Any, indent: bool = True, sort_keys: bool = False) -> bytes:
+	if orjson is not None:
+		option = orjson.OPT_NON_STR_KEYS
+		if indent:
+			option |= orjson.OPT_INDENT_2
+		if sort_keys:
+			option |= orjson.OPT_SORT_KEYS
+		return orjson.dumps(obj, option=option)
+
+	# Same bytes as orjson for the data we store, so hashes don't depend on the backend
+	if indent:
+		return json.dumps(obj, indent=2, sort_keys=sort_keys, ensure_ascii=False).encode()
+	return json.dumps(obj, separators=(',', ':'), sort_keys=sort_keys, ensure_ascii=False).encode()
+
+
+def loads(data: bytes | str) -> Any:
+	if orjson is not None:
+		return orjson.loads(data)
+	return json.loads(data)
+
+
+def read_json(path: Path) -> Any:
+	return loads(path.read_bytes())
+
+
+def read_jsonl(path: Path) -> list[Any]:
+	"""Records of an append-only log, cutting off a torn final line so later appends start on a clean line"""
+	data = path.read_bytes()
+	records = []
+	good = 0
+	for line in data.splitlines(keepends=True):
+		try:
+			records.append(loads(line))
+		except ValueError:
+			break  # Torn final line from a crash mid-append
+		good += len(line)
+
+	if good < len(data):
+		with open(path, 'r+b') as f:
+			f.truncate(good)
+	elif data and not data.endswith(b'\n'):
+		with open(path, 'ab') as f:
+			f.write(b'\n')  # Complete record whose newline never made it to disk
+	return records
+
+
+def write_json(path: Path, obj: Any, fsync: bool = False) -> None:
+	write_bytes(path, dumps(obj), fsync=fsync)
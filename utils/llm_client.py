@@ -1,3 +1,4 @@
+from collections.abc import Generator
 from typing import Any, Literal
 
 from .logger import logger
@@ -23,30 +24,50 @@ class UnifiedLLMClient:
 
 		raise ValueError('Unsupported LLM client. Must be Anthropic, OpenAI, or OpenRouter instance.')
 
-	def generate(self, prompt: str, max_tokens: int = 1000) -> str:
+	def generate(self, prompt: str, max_tokens: int = 1000, system: str | None = None) -> str:
+		"""Fixed instructions go in `system`, the per-call data in `prompt`."""
 		try:
 			if self.client_type == 'anthropic':
-				return self._call_anthropic(prompt, max_tokens)
+				return self._call_anthropic(prompt, max_tokens, system)
 			elif self.client_type == 'openrouter':
-				return self._call_openrouter(prompt, max_tokens)
+				return self._call_openrouter(prompt, max_tokens, system)
 			else:
-				return self._call_openai(prompt, max_tokens)
+				return self._call_openai(prompt, max_tokens, system)
 		except Exception as e:
 			logger.error(f'LLM generation failed ({self.client_type}): {e}')
 			raise RuntimeError(f'Failed to generate text: {e}') from e
 
-	def _call_anthropic(self, prompt: str, max_tokens: int) -> str:
+	def generate_stream(self, prompt: str, max_tokens: int = 1000) -> Generator[str, None, None]:
+		"""Yield text chunks as the provider produces them. Closing the iterator aborts the request."""
+		try:
+			if self.client_type == 'anthropic':
+				yield from self._stream_anthropic(prompt, max_tokens)
+			else:
+				yield from self._stream_openai(prompt, max_tokens)
+		except Exception as e:
+			logger.error(f'LLM streaming failed ({self.client_type}): {e}')
+			raise RuntimeError(f'Failed to stream text: {e}') from e
+
+	def _chat_messages(self, prompt: str, system: str | None) -> list[dict[str, Any]]:
+		messages: list[dict[str, Any]] = [{'role': 'user', 'content': prompt}]
+		if system:
+			messages.insert(0, {'role': 'system', 'content': system})
+		return messages
+
+	def _call_anthropic(self, prompt: str, max_tokens: int, system: str | None = None) -> str:
+		extra = {'system': system} if system else {}
 		response = self.client.messages.create(
 			model=self.model,
 			max_tokens=max_tokens,
 			messages=[{'role': 'user', 'content': prompt}],
+			**extra,
 		)
 		return response.content[0].text
 
-	def _call_openai(self, prompt: str, max_tokens: int) -> str:
+	def _call_openai(self, prompt: str, max_tokens: int, system: str | None = None) -> str:
 		response = self.client.chat.completions.create(
 			model=self.model,
-			messages=[{'role': 'user', 'content': prompt}],
+			messages=self._chat_messages(prompt, system),
 			max_tokens=max_tokens,
 		)
 		if not response or not hasattr(response, 'choices') or not response.choices:
@@ -54,7 +75,7 @@ class UnifiedLLMClient:
 			raise RuntimeError('OpenAI returned an empty or invalid response')
 		return response.choices[0].message.content
 
-	def _call_openrouter(self, prompt: str, max_tokens: int) -> str:
+	def _call_openrouter(self, prompt: str, max_tokens: int, system: str | None = None) -> str:
 		extra_headers = {}
 		if self.site_url:
 			extra_headers['HTTP-Referer'] = self.site_url
@@ -63,7 +84,7 @@ class UnifiedLLMClient:
 
 		response = self.client.chat.completions.create(
 			model=self.model,
-			messages=[{'role': 'user', 'content': prompt}],
+			messages=self._chat_messages(prompt, system),
 			max_tokens=max_tokens,
 			extra_headers=extra_headers,
 		)
@@ -71,3 +92,33 @@ class UnifiedLLMClient:
 			logger.error(f'OpenRouter response missing choices: {response}')
 			raise RuntimeError('OpenRouter returned an empty or invalid response')
 		return response.choices[0].message.content
+
+	def _stream_anthropic(self, prompt: str, max_tokens: int) -> Generator[str, None, None]:
+		with self.client.messages.stream(
+			model=self.model,
+			max_tokens=max_tokens,
+			messages=[{'role': 'user', 'content': prompt}],
+		) as stream:
+			yield from stream.text_stream
+
+	def _stream_openai(self, prompt: str, max_tokens: int) -> Generator[str, None, None]:
+		extra_headers = {}
+		if self.client_type == 'openrouter':
+			if self.site_url:
+				extra_headers['HTTP-Referer'] = self.site_url
+			if self.app_name:
+				extra_headers['X-Title'] = self.app_name
+
+		stream = self.client.chat.completions.create(
+			model=self.model,
+			messages=[{'role': 'user', 'content': prompt}],
+			max_tokens=max_tokens,
+			stream=True,
+			extra_headers=extra_headers or None,
+		)
+		try:
+			for chunk in stream:
+				if chunk.choices and chunk.choices[0].delta.content:
+					yield chunk.choices[0].delta.content
+		finally:
+			stream.close()